@@ -0,0 +1,259 @@
+import asyncio
+
+import aiohttp
+
+from highlevel_sdk_python.highlevel_sdk.client import (
+    Cursor,
+    HighLevelClient,
+    HighLevelRequest,
+    HighLevelResponse,
+    json_dumps,
+)
+
+
+async def _discard_tasks(tasks):
+    """
+    Cancels pending tasks and collects the results of finished ones, so nothing
+    is left running or logged as an unretrieved exception.
+    """
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+class AsyncHighLevelClient(object):
+    """
+    Encapsulates an aiohttp session and methods to make concurrent API calls.
+    """
+
+    CONNECTION_LIMIT = 100
+    MAX_CONCURRENCY = 10
+    TIMEOUT = aiohttp.ClientTimeout(total=30, connect=5)
+
+    def __init__(self, max_concurrency=None) -> None:
+        """
+        Args:
+            max_concurrency (optional): Maximum number of requests in flight at once.
+        """
+        self._session = None
+        self._tasks = set()
+        self._semaphore = asyncio.Semaphore(max_concurrency or self.MAX_CONCURRENCY)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    def get_session(self):
+        """
+        Returns the session shared by every call made with this client, creating it on first use.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.CONNECTION_LIMIT,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=75,
+                ),
+                timeout=self.TIMEOUT,
+            )
+        return self._session
+
+    def create_task(self, coro):
+        """
+        Schedules a background call, such as a cursor prefetch, that close() cancels.
+        """
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._task_done)
+        return task
+
+    def _task_done(self, task):
+        self._tasks.discard(task)
+        # a prefetch nobody awaits is not an error, awaiting it still raises
+        if not task.cancelled():
+            task.exception()
+
+    async def close(self):
+        """
+        Cancels outstanding background calls, closes the session and releases its connections.
+        """
+        if self._tasks:
+            await _discard_tasks(list(self._tasks))
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _call(self, method, path, token_data=None, data=None):
+        # full urls, such as a page's nextPageUrl, are requested as they are
+        if not path.startswith("https://"):
+            path = HighLevelClient._url_prefix + path
+        access_token = token_data["access_token"]
+        headers = HighLevelClient.build_headers(access_token=access_token)
+
+        if method in ("GET", "DELETE"):
+            # aiohttp rejects None and bool values, encode them the way the
+            # sync client does so the same params work on both
+            params = data and {
+                k: (("true" if v else "false") if isinstance(v, bool) else v)
+                for k, v in data.items()
+                if v is not None
+            }
+            kwargs = {"params": params}
+        else:
+            kwargs = {"data": json_dumps(data) if data is not None else None}
+
+        async with self._semaphore:
+            async with self.get_session().request(
+                method, path, headers=headers, **kwargs
+            ) as response:
+                body = await response.read()
+
+        highlevel_response = HighLevelResponse(
+            body=body,
+            headers=response.headers,
+            status_code=response.status,
+            call={"method": method, "path": path, "params": data, "headers": headers},
+        )
+
+        # push token_data to response
+        highlevel_response.token_data = token_data
+
+        if highlevel_response.is_error():
+            raise highlevel_response.error()
+
+        return highlevel_response
+
+
+class AsyncHighLevelRequest(HighLevelRequest):
+    """
+    Encapsulates request attributes and methods for use with AsyncHighLevelClient
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def _default_api(cls):
+        # the sync default client would block the event loop
+        raise TypeError(f"{cls.__name__} requires an AsyncHighLevelClient as api")
+
+    async def execute(self):
+        params = self._copy_params()
+        if self._api_type == "EDGE" and self._method == "GET":
+            cursor = AsyncCursor(
+                target_objects_class=self._target_class,
+                params=params,
+                endpoint=self._endpoint,
+                token_data=self.token_data,
+                api=self._api,
+                object_parser=self._response_parser,
+                custom_pagination_fn=self._custom_pagination_fn,
+                path=self._path,
+                lazy=self._lazy,
+                track_headers=self._track_headers,
+            )
+            await cursor.load_next_page()
+            return cursor
+        response = await self._api._call(
+            method=self._method,
+            path=self._path,
+            data=params,
+            token_data=self.token_data,
+        )
+
+        if response.error():
+            raise response.error()
+        if self._response_parser:
+            return self._response_parser.parse_single(
+                response.json(), self._target_class, self.token_data
+            )
+        else:
+            return response
+
+
+class AsyncCursor(Cursor):
+    """
+    Iterates asynchronously over pages of data.
+
+    custom_pagination_fn must be a coroutine function taking the cursor.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def _default_api(cls):
+        # the sync default client would block the event loop
+        raise TypeError(f"{cls.__name__} requires an AsyncHighLevelClient as api")
+
+    def __iter__(self):
+        raise TypeError("AsyncCursor must be iterated with 'async for'")
+
+    def __aiter__(self):
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    async def aclose(self):
+        """
+        Cancels the prefetch of the next page, for cursors that are not read to the end.
+        """
+        prefetch, self._prefetch = self._prefetch, None
+        if prefetch is not None:
+            await _discard_tasks([prefetch])
+
+    async def __anext__(self):
+        if not self._queue:
+            # the last page is only loaded when the previous one reported more
+            if not self._has_next_page:
+                raise StopAsyncIteration()
+            await self.load_next_page()
+            if not self._queue:
+                raise StopAsyncIteration()
+
+        return self._queue.popleft()
+
+    async def load_next_page(self):
+        """
+        Loads the next page of data.
+
+        Returns:
+            bool: True if there is a next page, False otherwise.
+        """
+        if self.custom_pagination_fn:
+            has_next_page = await self.custom_pagination_fn(self)
+        else:
+            has_next_page = await self.load_next_page_meta()
+        self._has_next_page = bool(has_next_page)
+
+        # start fetching the following page while the caller consumes this one
+        if has_next_page:
+            self._prefetch = self._api.create_task(
+                self._fetch_page(*self._page_request())
+            )
+        return has_next_page
+
+    async def _fetch_page(self, path, params):
+        return await self._api._call(
+            method="GET",
+            path=path,
+            data=params,
+            token_data=self.token_data,
+        )
+
+    async def _next_response(self):
+        """
+        Returns the response for the next page, using the prefetched one if there is one.
+        """
+        prefetch, self._prefetch = self._prefetch, None
+        if prefetch is not None:
+            return await prefetch
+        return await self._fetch_page(*self._page_request())
+
+    async def load_next_page_meta(self):
+        response = await self._next_response()
+        return self._load_meta_page(response)
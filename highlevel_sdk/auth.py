@@ -1,5 +1,5 @@
 from flask import Flask, redirect, request, jsonify
-import requests
+import httpx
 from urllib.parse import urlencode
 from highlevel_sdk_python.highlevel_sdk.config import HighLevelConfig
 # from config import HighLevelConfig
@@ -11,7 +11,7 @@ app = Flask(__name__)
 @app.route("/initiate")
 def initiate_auth():
     app_config = {
-        "clientId": HighLevelConfig.CLIENT_ID,
+        "clientId": HighLevelConfig.client_id(),
         "baseUrl": HighLevelConfig.AUTH_BASE_URL,
     }
 
@@ -37,8 +37,8 @@ def initiate_auth():
 @app.route("/oauth/callback")
 def handle_callback():
     app_config = {
-        "clientId": HighLevelConfig.CLIENT_ID,
-        "clientSecret": HighLevelConfig.CLIENT_SECRET,
+        "clientId": HighLevelConfig.client_id(),
+        "clientSecret": HighLevelConfig.client_secret(),
     }
 
     data = {
@@ -54,7 +54,7 @@ def handle_callback():
         "Accept": "application/json",
         "Content-Type": "application/x-www-form-urlencoded",
     }
-    response = requests.post(
+    response = httpx.post(
         f"{HighLevelConfig.API_BASE_URL}/oauth/token", data=data, headers=headers
     )
 
@@ -63,8 +63,8 @@ def handle_callback():
 
 def refresh_token(refresh_token):
     app_config = {
-        "clientId": HighLevelConfig.CLIENT_ID,
-        "clientSecret": HighLevelConfig.CLIENT_SECRET,
+        "clientId": HighLevelConfig.client_id(),
+        "clientSecret": HighLevelConfig.client_secret(),
     }
 
     data = {
@@ -81,7 +81,7 @@ def refresh_token(refresh_token):
         "Content-Type": "application/x-www-form-urlencoded",
     }
 
-    response = requests.post(
+    response = httpx.post(
         f"{HighLevelConfig.API_BASE_URL}/oauth/token", data=data, headers=headers
     )
 
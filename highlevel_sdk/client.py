@@ -1,21 +1,183 @@
-from copy import deepcopy
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 import json
-from requests import get, post, put, delete
+from functools import lru_cache
 from time import sleep
+from types import MappingProxyType
+
+import httpx
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 from highlevel_sdk_python.highlevel_sdk.config import HighLevelConfig
 from highlevel_sdk_python.highlevel_sdk.exceptions import HighLevelRequestException
 
 
+# document() parses bodies larger than this with simdjson when it is installed
+LARGE_BODY_THRESHOLD = 16 * 1024
+# streamed pages at least this large are parsed incrementally with ijson when it is installed
+STREAM_BODY_THRESHOLD = 64 * 1024
+
+if simdjson is not None:
+    JSON_OBJECT_TYPES = (dict, simdjson.Object)
+    JSON_ARRAY_TYPES = (list, simdjson.Array)
+else:
+    JSON_OBJECT_TYPES = (dict,)
+    JSON_ARRAY_TYPES = (list,)
+
+_PRIMITIVE_TYPES = frozenset((str, int, float, bool, type(None)))
+
+
+def json_loads(data):
+    """
+    Parses a JSON document from bytes or str, using orjson when it is installed.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(data):
+    """
+    Serializes data to JSON bytes, using orjson when it is installed.
+    """
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode("utf-8")
+
+
+def _iter_stream_members(events):
+    """
+    Rebuilds the top-level members of a JSON object from ijson parse events.
+
+    Yields (key, value) pairs, one pair per item for array members, so records
+    are available as soon as they have been read.
+    """
+    key = None
+    builder = None
+    depth = 0
+    for prefix, event, value in events:
+        if builder is not None:
+            builder.event(event, value)
+            if event in ("start_map", "start_array"):
+                depth += 1
+            elif event in ("end_map", "end_array"):
+                depth -= 1
+                if not depth:
+                    yield key, builder.value
+                    builder = None
+        elif prefix == "":
+            if event == "map_key":
+                key = value
+        elif prefix == key and event in ("start_array", "end_array"):
+            # top-level array, its items are yielded one by one
+            continue
+        elif event in ("start_map", "start_array"):
+            builder = ijson.ObjectBuilder()
+            builder.event(event, value)
+            depth = 1
+        else:
+            yield key, value
+
+
+def _retry_after(response, default):
+    """
+    Returns the delay in seconds asked for by a Retry-After header, or default.
+    """
+    value = response.headers.get("Retry-After")
+    if not value:
+        return default
+    try:
+        return max(float(value), 0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return default
+    if retry_at.tzinfo is None:
+        # "-0000" dates parse as naive, they are still UTC
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0)
+
+
+class _StreamReader(object):
+    """
+    File-like view of a streamed httpx response body, as read by ijson.
+    """
+
+    def __init__(self, response) -> None:
+        self._response = response
+        self._chunks = None
+
+    def read(self, size=-1):
+        # ijson probes the source with read(0) to tell bytes from text
+        if size == 0:
+            return b""
+        if self._chunks is None:
+            self._chunks = self._response.iter_bytes(
+                chunk_size=size if size > 0 else None
+            )
+        return next(self._chunks, b"")
+
+
 class HighLevelClient(object):
     """
     Encapsulates session attributes and methods to make API calls.
     """
 
+    LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+    TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+    MAX_RETRIES = 3
+    RETRY_STATUSES = frozenset((429, 502, 503, 504))
+    IDEMPOTENT_METHODS = frozenset(("GET", "DELETE", "PUT"))
+    RETRY_BACKOFF = 0.3
+    # longer Retry-After delays are returned to the caller rather than slept through
+    MAX_RETRY_AFTER = 60.0
+    PREFETCH_WORKERS = 4
+
+    _default = None
+    _url_prefix = HighLevelConfig.API_BASE_URL.rstrip("/")
+    _session = None
+    _executor = None
+
     def __init__(self) -> None:
         pass
 
+    @classmethod
+    def default(cls):
+        """
+        Returns the process-wide client used when a request or cursor is not given one.
+        """
+        if HighLevelClient._default is None:
+            HighLevelClient._default = cls()
+        return HighLevelClient._default
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @staticmethod
+    @lru_cache(maxsize=128)
     def build_headers(access_token=None):
+        # cached per token and read-only, since the same dict is shared by every call
         assert access_token != None, "Must provide access token"
         headers = {
             "Content-Type": "application/json",
@@ -23,40 +185,114 @@ class HighLevelClient(object):
         }
         if access_token:
             headers["Authorization"] = f"Bearer {access_token}"
-        return headers
+        return MappingProxyType(headers)
 
     @classmethod
-    def _call(cls, method, path, token_data=None, data=None):
-        path = HighLevelConfig.API_BASE_URL + path
+    def get_session(cls):
+        """
+        Returns the HTTP/2 client shared by every API call, creating it on first use.
+
+        Concurrent calls, such as cursor prefetches, are multiplexed as streams
+        over the same connection.
+        """
+        if cls._session is None:
+            # no custom transport, httpx only honours HTTP(S)_PROXY without one
+            cls._session = httpx.Client(
+                http2=True, limits=cls.LIMITS, timeout=cls.TIMEOUT
+            )
+        return cls._session
+
+    @classmethod
+    def get_executor(cls):
+        """
+        Returns the thread pool used by cursors to prefetch pages in the background.
+        """
+        if cls._executor is None:
+            cls._executor = ThreadPoolExecutor(
+                max_workers=cls.PREFETCH_WORKERS, thread_name_prefix="highlevel"
+            )
+        return cls._executor
+
+    @classmethod
+    def close(cls):
+        """
+        Closes the pooled session and releases its connections.
+        """
+        if cls._executor is not None:
+            cls._executor.shutdown(wait=True)
+            cls._executor = None
+        if cls._session is not None:
+            cls._session.close()
+            cls._session = None
+
+    @classmethod
+    def _call(cls, method, path, token_data=None, data=None, stream=False):
+        # full urls, such as a page's nextPageUrl, are requested as they are
+        if not path.startswith("https://"):
+            path = cls._url_prefix + path
         access_token = token_data["access_token"]
         headers = cls.build_headers(access_token=access_token)
 
-        # Try up to 3 times to make the request
-        RETRY_DELAY = 3
-        for i in range(3):
+        # access tokens differ per location, so headers are sent per call
+        # rather than stored on the shared session
+        session = cls.get_session()
+        stream = stream and ijson is not None
+        if method in ("GET", "DELETE"):
+            # httpx sends None params as empty values, the API expects them left out
+            params = data and {k: v for k, v in data.items() if v is not None}
+            request = session.build_request(method, path, headers=headers, params=params)
+        else:
+            # serialized once up front, retries resend the same bytes
+            body = json_dumps(data) if data is not None else None
+            request = session.build_request(method, path, headers=headers, content=body)
+
+        # POST may create records, so it is only resent when it never reached the server
+        idempotent = method in cls.IDEMPOTENT_METHODS
+        retry_delay = cls.RETRY_BACKOFF
+        for i in range(cls.MAX_RETRIES + 1):
+            last_attempt = i == cls.MAX_RETRIES
             try:
-                if method == "GET":
-                    response = get(path, headers=headers, params=data)
-                elif method == "DELETE":
-                    response = delete(path, headers=headers, params=data)
-                elif method == "POST":
-                    response = post(path, headers=headers, data=json.dumps(data))
-                elif method == "PUT":
-                    response = put(path, headers=headers, data=json.dumps(data))
-
-                break
-            except Exception as e:
-                if i == 2:
-                    raise e
-                sleep(RETRY_DELAY)
-                RETRY_DELAY *= 2
-                continue
+                response = session.send(request, stream=stream)
+            except (httpx.ConnectError, httpx.ConnectTimeout):
+                if last_attempt:
+                    raise
+                delay = retry_delay
+            except httpx.TransportError:
+                if last_attempt or not idempotent:
+                    raise
+                delay = retry_delay
+            else:
+                if (
+                    last_attempt
+                    or not idempotent
+                    or response.status_code not in cls.RETRY_STATUSES
+                ):
+                    break
+                delay = _retry_after(response, retry_delay)
+                if delay > cls.MAX_RETRY_AFTER:
+                    break
+                response.close()
+            sleep(delay)
+            retry_delay *= 2
+
+        # only large successful bodies are left on the connection to be parsed
+        # as they arrive, everything else is read up front
+        if (
+            stream
+            and response.status_code < 400
+            and int(response.headers.get("Content-Length") or 0)
+            >= STREAM_BODY_THRESHOLD
+        ):
+            body, stream = None, response
+        else:
+            body, stream = response.read(), None
 
         highlevel_response = HighLevelResponse(
-            body=response.text,
+            body=body,
             headers=response.headers,
             status_code=response.status_code,
             call={"method": method, "path": path, "params": data, "headers": headers},
+            stream=stream,
         )
 
         # push token_data to response
@@ -73,11 +309,31 @@ class HighLevelResponse(object):
     Encapsulates response attributes and methods.
     """
 
-    def __init__(self, body, headers, status_code, call) -> None:
+    __slots__ = (
+        "body",
+        "headers",
+        "status_code",
+        "call",
+        "token_data",
+        "_parsed",
+        "_stream",
+    )
+
+    def __init__(self, body, headers, status_code, call, stream=None) -> None:
+        """
+        Args:
+            body : The raw response body, None while it is still being streamed.
+            headers : The response headers.
+            status_code : The HTTP status code.
+            call : The method, path, params and headers of the call.
+            stream (optional): The unread httpx.Response to stream the body from.
+        """
         self.body = body
         self.headers = headers
         self.status_code = status_code
         self.call = call
+        self._parsed = None
+        self._stream = stream
 
     def is_error(self):
         return self.status_code >= 400
@@ -94,14 +350,72 @@ class HighLevelResponse(object):
         else:
             return None
 
+    def is_streamed(self):
+        return self._stream is not None
+
+    def _read_body(self):
+        if self._stream is not None:
+            self.body = self._stream.read()
+            self._stream = None
+        return self.body
+
+    def iter_members(self):
+        """
+        Yields (key, value) pairs for the top-level members of the body, one pair
+        per item for array members.
+
+        Streamed bodies are parsed incrementally with ijson while they are read
+        from the connection, without buffering the raw bytes.
+        """
+        if self._stream is None:
+            for key, value in self.json().items():
+                if isinstance(value, JSON_ARRAY_TYPES):
+                    for item in value:
+                        yield key, item
+                else:
+                    yield key, value
+            return
+
+        stream, self._stream = self._stream, None
+        try:
+            yield from _iter_stream_members(
+                ijson.parse(_StreamReader(stream), use_float=True)
+            )
+        finally:
+            stream.close()
+
     def json(self):
-        return json.loads(self.body)
+        # parsed once on first access, later calls reuse the result
+        if self._parsed is None:
+            self._read_body()
+            self._parsed = json_loads(self.body)
+        return self._parsed
+
+    def document(self):
+        """
+        Returns the parsed body for read-only access.
+
+        Large bodies are parsed lazily with simdjson when it is installed, so only
+        the keys that are read get converted to Python objects. Each document has
+        a parser of its own and stays valid for as long as it is referenced.
+        Converting the whole document is slower than json(), so use it only when
+        most of the body is never read.
+        """
+        self._read_body()
+        if simdjson is None or len(self.body) <= LARGE_BODY_THRESHOLD:
+            return self.json()
+        return simdjson.Parser().parse(self.body)
 
     def text(self):
+        self._read_body()
+        if isinstance(self.body, bytes):
+            return self.body.decode("utf-8", errors="replace")
         return self.body
 
     def __repr__(self):
-        return f"<HighLevelResponse {self.status_code} {self.body}>"
+        if self.is_streamed():
+            return f"<HighLevelResponse {self.status_code} (streamed)>"
+        return f"<HighLevelResponse {self.status_code} {self.text()}>"
 
 
 class HighLevelRequest(object):
@@ -109,6 +423,26 @@ class HighLevelRequest(object):
     Encapsulates request attributes and methods
     """
 
+    __slots__ = (
+        "_method",
+        "_node",
+        "_endpoint",
+        "token_data",
+        "_api",
+        "_api_type",
+        "_path",
+        "_params",
+        "_target_class",
+        "_response_parser",
+        "_custom_pagination_fn",
+        "_lazy",
+        "_track_headers",
+    )
+
+    @classmethod
+    def _default_api(cls):
+        return HighLevelClient.default()
+
     def __init__(
         self,
         method,
@@ -120,33 +454,43 @@ class HighLevelRequest(object):
         target_class=None,
         response_parser=None,
         custom_pagination_fn=None,
+        lazy=False,
+        track_headers=False,
     ) -> None:
         """
         Args:
             method : The HTTP method to use for the request.
             node : The node to use for the request.
             endpoint : The endpoint to use for the request.
+            api (optional): The client to make calls with, defaults to HighLevelClient.default().
             api_type (optional): The type of API call to make.
             param_checker (optional): The type checker to use for the request.
             target_class (optional): The class to use for the request.
             response_parser (optional): The parser to use for the response.
             custom_pagination_fn (optional): Custom pagination function to use for the cursor.
+            lazy (optional): Return read-only LazyAbstractObject records from the cursor.
+            track_headers (optional): Keep each page's response headers on the cursor.
 
         """
         self._method = method
         self._node = node
         self._endpoint = endpoint
         self.token_data = token_data
-        self._api = api
+        self._api = api or self._default_api()
         self._api_type = api_type
-        if bool(node):
-            self._path = f"{endpoint}/{node}"
+        # edge listings are paged from the endpoint itself
+        if api_type == "EDGE" and method == "GET":
+            self._path = endpoint
+        elif bool(node):
+            self._path = endpoint + "/" + str(node)
         else:
-            self._path = f"{endpoint}/"
+            self._path = endpoint + "/"
         self._params = {}
         self._target_class = target_class
         self._response_parser = response_parser
         self._custom_pagination_fn = custom_pagination_fn
+        self._lazy = lazy
+        self._track_headers = track_headers
 
     def add_param(self, key, value):
         self._params[key] = self._extract_value(value)
@@ -160,20 +504,36 @@ class HighLevelRequest(object):
         return self
 
     def _extract_value(self, value):
-        if hasattr(value, "export_all_data"):
-            return value.export_all_data()
+        # exact type checks first, they cover nearly every param and skip the
+        # attribute lookup; keys are left alone since they are always strings
+        value_type = type(value)
+        if value_type in _PRIMITIVE_TYPES:
+            return value
+        if value_type is dict:
+            return {k: self._extract_value(v) for k, v in value.items()}
+        if value_type is list:
+            return [self._extract_value(item) for item in value]
+
+        export_all_data = getattr(value, "export_all_data", None)
+        if export_all_data is not None:
+            return export_all_data()
         elif isinstance(value, list):
             return [self._extract_value(item) for item in value]
         elif isinstance(value, dict):
-            return dict(
-                (self._extract_value(k), self._extract_value(v))
-                for (k, v) in value.items()
-            )
+            return {k: self._extract_value(v) for k, v in value.items()}
         else:
             return value
 
+    def _copy_params(self):
+        # _extract_value already built fresh containers, so one level of copying
+        # is enough to keep the cursor from mutating the request's params
+        return {
+            k: (v.copy() if isinstance(v, (dict, list)) else v)
+            for k, v in self._params.items()
+        }
+
     def execute(self):
-        params = deepcopy(self._params)
+        params = self._copy_params()
         if self._api_type == "EDGE" and self._method == "GET":
             cursor = Cursor(
                 target_objects_class=self._target_class,
@@ -183,6 +543,9 @@ class HighLevelRequest(object):
                 api=self._api,
                 object_parser=self._response_parser,
                 custom_pagination_fn=self._custom_pagination_fn,
+                path=self._path,
+                lazy=self._lazy,
+                track_headers=self._track_headers,
             )
             cursor.load_next_page()
             return cursor
@@ -208,6 +571,29 @@ class Cursor(object):
     Iterates over pages of data.
     """
 
+    __slots__ = (
+        "_target_objects_class",
+        "_params",
+        "_endpoint",
+        "token_data",
+        "_api",
+        "_path",
+        "_object_parser",
+        "_queue",
+        "_headers",
+        "_has_next_page",
+        "_next_page",
+        "_start_after_id",
+        "_prefetch",
+        "custom_pagination_fn",
+        "_lazy",
+        "_track_headers",
+    )
+
+    @classmethod
+    def _default_api(cls):
+        return HighLevelClient.default()
+
     def __init__(
         self,
         target_objects_class,
@@ -217,6 +603,9 @@ class Cursor(object):
         api,
         object_parser,
         custom_pagination_fn=None,
+        path=None,
+        lazy=False,
+        track_headers=False,
     ) -> None:
         """
         Args:
@@ -224,25 +613,36 @@ class Cursor(object):
             params : The parameters to use for the request.
             node : The node to use for the request.
             endpoint : The endpoint to use for the request.
+            api : The client to make calls with, HighLevelClient.default() if None.
             object_parser : The parser to use for the response.
             custom_pagination_fn (optional): Custom pagination function to use for the cursor.
+            path (optional): The path to request, defaults to the endpoint.
+            lazy (optional): Yield read-only LazyAbstractObject records that convert
+                fields on access. Only applies to meta paginated cursors.
+            track_headers (optional): Keep the latest page's response headers for
+                headers(). Off by default so responses can be freed once parsed.
         """
 
         self._target_objects_class = target_objects_class
         self._params = params
         self._endpoint = endpoint
         self.token_data = token_data
-        self._api = api
-        self._path = f"{endpoint}"
+        self._api = api or self._default_api()
+        self._path = endpoint if path is None else path
         self._object_parser = object_parser
-        self._queue = []
+        self._queue = deque()
         self._headers = None
-        self._has_next_page = False
+        # nothing loaded yet, so the first page is still to come
+        self._has_next_page = True
+        self._next_page = None
         self._start_after_id = None
+        self._prefetch = None
         self.custom_pagination_fn = custom_pagination_fn
+        self._lazy = lazy
+        self._track_headers = track_headers
 
     def __repr__(self):
-        return str(self._queue)
+        return str(list(self._queue))
 
     def __len__(self):
         return len(self._queue)
@@ -251,12 +651,19 @@ class Cursor(object):
         return self
 
     def __next__(self):
-        if not self._queue and not self.load_next_page():
-            raise StopIteration()
+        if not self._queue:
+            # the last page is only loaded when the previous one reported more
+            if not self._has_next_page:
+                raise StopIteration()
+            self.load_next_page()
+            if not self._queue:
+                raise StopIteration()
 
-        return self._queue.pop(0)
+        return self._queue.popleft()
 
     def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self._queue)[index]
         return self._queue[index]
 
     def headers(self):
@@ -270,35 +677,130 @@ class Cursor(object):
             bool: True if there is a next page, False otherwise.
         """
         if self.custom_pagination_fn:
-            return self.custom_pagination_fn(self)
+            has_next_page = self.custom_pagination_fn(self)
         else:
-            return self.load_next_page_meta()
+            has_next_page = self.load_next_page_meta()
+        self._has_next_page = bool(has_next_page)
+
+        # start fetching the following page while the caller consumes this one.
+        # Meta pages are parsed on the worker as well, so a large page is read
+        # straight into records and its connection is released right away.
+        if has_next_page:
+            fetch = self._fetch_page if self.custom_pagination_fn else self._read_page
+            self._prefetch = self._api.get_executor().submit(
+                fetch, *self._page_request()
+            )
+        return has_next_page
 
-    def load_next_page_meta(self):
+    def _page_request(self):
+        """
+        Returns the path and params for the next page. Once the server has given a
+        nextPageUrl it already carries every query param, so none are sent.
+        """
+        if self._next_page:
+            return self._next_page, None
+        return self._path, dict(self._params)
 
-        response = self._api._call(
+    def _fetch_page(self, path, params, stream=False):
+        return self._api._call(
             method="GET",
-            path=self._path,
-            data=self._params,
+            path=path,
+            data=params,
             token_data=self.token_data,
+            stream=stream,
         )
 
-        self._headers = response.headers
+    def _read_page(self, path, params):
+        """
+        Fetches a meta paginated page and parses its records. Runs on the prefetch
+        workers too, so it leaves the cursor's state alone.
 
+        Returns:
+            tuple: the response, its records and the body's paging members.
+        """
+        # lazy records are backed by the whole document, so it is never streamed
+        response = self._fetch_page(path, params, stream=not self._lazy)
+        return (response,) + self._parse_page(response)
+
+    def _parse_page(self, response):
+        """
+        Returns the records of a page response and the body's paging members.
+        """
+        if self._lazy:
+            # each page keeps its own document alive for as long as its records live
+            body = response.document()
+            return self._object_parser.parse_lazy(body), body
+        if response.is_streamed():
+            body = {}
+            records = list(
+                self._object_parser.parse_stream(
+                    response.iter_members(),
+                    self._target_objects_class,
+                    self.token_data,
+                    skipped=body,
+                )
+            )
+            return records, body
         body = response.json()
-        self._queue = self._object_parser.parse_multiple(
+        records = self._object_parser.parse_multiple(
             body, self._target_objects_class, self.token_data
         )
+        return records, body
+
+    def _next_response(self):
+        """
+        Returns the response for the next page, using the prefetched one if there is one.
+        """
+        prefetch, self._prefetch = self._prefetch, None
+        if prefetch is not None:
+            return prefetch.result()
+        return self._fetch_page(*self._page_request())
+
+    def load_next_page_meta(self):
+        prefetch, self._prefetch = self._prefetch, None
+        if prefetch is not None:
+            page = prefetch.result()
+        else:
+            page = self._read_page(*self._page_request())
+        return self._load_meta_page(*page)
+
+    def _load_meta_page(self, response, records=None, body=None):
+        """
+        Fills the queue from a page response and advances the params using its meta.
+
+        Args:
+            response : The page response.
+            records (optional): The page's records, if it has already been parsed.
+            body (optional): The body's paging members, given with records.
+
+        Returns:
+            bool: True if there is a next page, False otherwise.
+        """
+        if self._track_headers:
+            self._headers = response.headers
+
+        if records is None:
+            records, body = self._parse_page(response)
+        self._queue = deque(records)
         if not self._queue:
             return False
-        if not body.get("meta"):
+        meta = body.get("meta")
+        if not meta:
             return False
         self._has_next_page = (
-            body["meta"]["nextPage"] is not None
-            and body["meta"]["startAfter"] is not None
+            meta["nextPage"] is not None and meta["startAfter"] is not None
         )
-        self._params["startAfter"] = body["meta"]["startAfter"]
-        self._params["startAfterId"] = body["meta"]["startAfterId"]
+        self._params["startAfter"] = meta["startAfter"]
+        self._params["startAfterId"] = meta["startAfterId"]
+
+        # only follow urls on the API host, they are sent with the access token
+        next_page_url = meta.get("nextPageUrl")
+        if next_page_url and next_page_url.startswith(
+            HighLevelClient._url_prefix + "/"
+        ):
+            self._next_page = next_page_url
+        else:
+            self._next_page = None
 
         if not self._has_next_page:
             return False
@@ -1,12 +1,11 @@
 import os
-from dotenv import load_dotenv
-
-load_dotenv()
+from functools import lru_cache
 
 
 class HighLevelConfig(object):
-    CLIENT_ID = os.environ.get("GHL_CLIENT_ID", None)
-    CLIENT_SECRET = os.environ.get("GHL_CLIENT_SECRET", None)
+    # set these to override the GHL_CLIENT_ID / GHL_CLIENT_SECRET environment variables
+    CLIENT_ID = None
+    CLIENT_SECRET = None
     API_BASE_URL = "https://services.leadconnectorhq.com"
     AUTH_BASE_URL = "https://marketplace.gohighlevel.com"
     VERSION = "2021-07-28"
@@ -31,3 +30,30 @@ class HighLevelConfig(object):
         "workflows.readonly",
     ]
     REDIRECT_URI = "http://localhost:3000/oauth/callback"
+
+    _dotenv_loaded = False
+
+    @classmethod
+    def init(cls):
+        """
+        Loads the .env file into the environment. Runs once, on first use of a setting.
+        """
+        if not cls._dotenv_loaded:
+            from dotenv import load_dotenv
+
+            load_dotenv()
+            HighLevelConfig._dotenv_loaded = True
+
+    @classmethod
+    def client_id(cls):
+        return cls.CLIENT_ID or cls._env("GHL_CLIENT_ID")
+
+    @classmethod
+    def client_secret(cls):
+        return cls.CLIENT_SECRET or cls._env("GHL_CLIENT_SECRET")
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _env(name):
+        HighLevelConfig.init()
+        return os.environ.get(name)
@@ -12,6 +12,8 @@ class HighLevelRequestException(HighLevelError):
         self._request_context = request_context
         self._http_status = http_status
         self._http_headers = http_headers
+        if isinstance(body, bytes):
+            body = body.decode("utf-8", errors="replace")
         try:
             self._body = json.loads(body)
         except (TypeError, ValueError):
@@ -1,7 +1,13 @@
 import json
 import collections.abc as collections_abc
+import threading
+from weakref import WeakValueDictionary
 from highlevel_sdk_python.highlevel_sdk.client import HighLevelClient
 
+# cursors parse prefetched pages on worker threads, so identity map lookups
+# and updates are serialized
+_identity_lock = threading.Lock()
+
 
 class AbstractObject(collections_abc.MutableMapping):
 
@@ -14,7 +20,7 @@ class AbstractObject(collections_abc.MutableMapping):
 
     def __init__(self, token_data=None, id=None):
         self._data = {}
-        self.api = HighLevelClient
+        self.api = HighLevelClient.default()
 
         if id:
             self["id"] = id
@@ -125,7 +131,85 @@ class AbstractObject(collections_abc.MutableMapping):
         return self.export_value(self._data)
 
     def create_object(data, target_class, token_data):
-        new_object = target_class()
-        new_object._set_data(data)
-        new_object.set_token_data(token_data)
-        return new_object
+        # records already loaded for this class are refreshed in place rather than
+        # duplicated, the map holds weak references so unused objects are still freed
+        with _identity_lock:
+            identity_map = target_class.__dict__.get("_identity_map")
+            if identity_map is None:
+                identity_map = target_class._identity_map = WeakValueDictionary()
+
+            object_id = data.get("id")
+            if isinstance(object_id, str):
+                existing = identity_map.get(object_id)
+                if existing is not None:
+                    # merged, so fields missing from a shorter listing copy are kept,
+                    # and the token the caller's object was loaded with is left alone
+                    existing._set_data(data)
+                    if getattr(existing, "token_data", None) is None:
+                        existing.set_token_data(token_data)
+                    return existing
+
+            new_object = target_class()
+            new_object._set_data(data)
+            new_object.set_token_data(token_data)
+            if isinstance(object_id, str):
+                identity_map[object_id] = new_object
+            return new_object
+
+
+class LazyAbstractObject(collections_abc.Mapping):
+
+    """
+    Read-only record that converts fields to Python values on first access.
+
+    Backed by the parsed page (a simdjson object for large pages), which it keeps
+    alive; export_all_data() returns an independent dict. Fields can be read as
+    items or attributes. Model methods are not available on these records.
+    """
+
+    __slots__ = ("_source", "_cache")
+
+    def __init__(self, source):
+        self._source = source
+        self._cache = {}
+
+    def __getitem__(self, key):
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+        value = self._source[key]
+        if hasattr(value, "as_dict"):
+            value = value.as_dict()
+        elif hasattr(value, "as_list"):
+            value = value.as_list()
+        self._cache[key] = value
+        return value
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __iter__(self):
+        return iter(self._source.keys())
+
+    def __len__(self):
+        return len(self._source)
+
+    def __contains__(self, key):
+        return key in self._cache or key in self._source
+
+    def __repr__(self):
+        return "<%s> %s" % (
+            self.__class__.__name__,
+            json.dumps(self.export_all_data(), sort_keys=True, indent=4),
+        )
+
+    def export_all_data(self):
+        if hasattr(self._source, "as_dict"):
+            return self._source.as_dict()
+        return dict(self._source)
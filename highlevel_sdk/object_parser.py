@@ -1,5 +1,14 @@
+from highlevel_sdk_python.highlevel_sdk.client import JSON_ARRAY_TYPES, JSON_OBJECT_TYPES
 from highlevel_sdk_python.highlevel_sdk.exceptions import HighLevelError
-from highlevel_sdk_python.highlevel_sdk.models.abstract_object import AbstractObject
+from highlevel_sdk_python.highlevel_sdk.models.abstract_object import (
+    AbstractObject,
+    LazyAbstractObject,
+)
+
+# top-level response keys holding paging data rather than records
+_NON_RECORD_KEYS = frozenset(
+    ("meta", "traceId", "aggregations", "total", "lastMessageId", "nextPage")
+)
 
 
 class ObjectParser(object):
@@ -7,31 +16,65 @@ class ObjectParser(object):
         if not target_class:
             raise HighLevelError("Must specify target class when parsing single object")
 
-        if isinstance(response, dict):
+        if isinstance(response, JSON_OBJECT_TYPES):
+            if not isinstance(response, dict):
+                # simdjson object, detach it from the parser's document
+                response = response.as_dict()
             return AbstractObject.create_object(response, target_class, token_data)
         else:
             raise HighLevelError("Must specify either target class calling object")
 
     def parse_multiple(response, target_class=None, token_data=None):
+        parse_single = ObjectParser.parse_single
+        create_object = AbstractObject.create_object
         ret = []
         for key in response.keys():
-            if key in [
-                "meta",
-                "traceId",
-                "aggregations",
-                "total",
-                "lastMessageId",
-                "nextPage",
-            ]:
+            if key in _NON_RECORD_KEYS:
                 continue
 
-            if isinstance(response[key], list):
-                for json_obj in response[key]:
-                    ret.append(
-                        ObjectParser.parse_single(json_obj, target_class, token_data)
-                    )
-            else:
-                ret.append(
-                    ObjectParser.parse_single(response[key], target_class, token_data)
+            value = response[key]
+            if isinstance(value, JSON_ARRAY_TYPES):
+                # plain dict records skip parse_single's checks, anything else still
+                # goes through it to be converted or rejected
+                ret.extend(
+                    [
+                        create_object(json_obj, target_class, token_data)
+                        if target_class and type(json_obj) is dict
+                        else parse_single(json_obj, target_class, token_data)
+                        for json_obj in value
+                    ]
                 )
+            else:
+                ret.append(parse_single(value, target_class, token_data))
+        return ret
+
+    def parse_stream(members, target_class=None, token_data=None, skipped=None):
+        """
+        Parses records from (key, value) pairs as they are read, see
+        HighLevelResponse.iter_members. Paging members are stored in skipped.
+        """
+        parse_single = ObjectParser.parse_single
+        for key, value in members:
+            if key in _NON_RECORD_KEYS:
+                if skipped is not None:
+                    skipped[key] = value
+                continue
+
+            yield parse_single(value, target_class, token_data)
+
+    def parse_lazy(response):
+        """
+        Wraps records in read-only LazyAbstractObjects, without converting them.
+        """
+        ret = []
+        # simdjson's items() converts every value, indexing by key keeps them lazy
+        for key in response.keys():
+            if key in _NON_RECORD_KEYS:
+                continue
+
+            value = response[key]
+            if isinstance(value, JSON_ARRAY_TYPES):
+                ret.extend([LazyAbstractObject(json_obj) for json_obj in value])
+            else:
+                ret.append(LazyAbstractObject(value))
         return ret
@@ -1,3 +1,38 @@
+from collections import deque
+
+
+def _next_body(cursor):
+    """
+    Fetches the cursor's next page and returns its parsed body.
+    """
+    return _page_body(cursor, cursor._next_response())
+
+
+async def _next_body_async(cursor):
+    """
+    Fetches an AsyncCursor's next page and returns its parsed body.
+    """
+    return _page_body(cursor, await cursor._next_response())
+
+
+def _page_body(cursor, response):
+    if cursor._track_headers:
+        cursor._headers = response.headers
+    return response.json()
+
+
+def _fill_queue(cursor, records):
+    """
+    Replaces the cursor's queue with the records parsed from a response object.
+    """
+    cursor._queue = deque(
+        cursor._object_parser.parse_multiple(
+            records, cursor._target_objects_class, cursor.token_data
+        )
+    )
+    return bool(cursor._queue)
+
+
 def paginate_conversations(cursor):
     """
     Custom Function to paginate through conversations. Overrides the load_next_page method in the Cursor class.
@@ -6,30 +41,28 @@ def paginate_conversations(cursor):
         cursor : Cursor object
 
     Returns:
-        list : list of conversations
+        bool : True if there is a next page, False otherwise.
     """
 
-    response = cursor._api._call(
-        method="GET",
-        path=cursor._path,
-        data=cursor._params,
-        token_data=cursor.token_data,
-    )
+    return _load_conversations(cursor, _next_body(cursor))
 
-    cursor._headers = response.headers
 
-    body = response.json()
-    cursor._queue = cursor._object_parser.parse_multiple(
-        body, cursor._target_objects_class, cursor.token_data
-    )
-    if not cursor._queue:
+async def paginate_conversations_async(cursor):
+    """
+    paginate_conversations for AsyncCursor.
+    """
+    return _load_conversations(cursor, await _next_body_async(cursor))
+
+
+def _load_conversations(cursor, body):
+    if not _fill_queue(cursor, body):
         return False
 
-    sort_by = cursor._params.get("sortBy")
-    if not sort_by:
+    params = cursor._params
+    if not params.get("sortBy"):
         return False
 
-    cursor._params["startAfterDate"] = cursor._queue[-1].get("lastMessageDate")
+    params["startAfterDate"] = cursor._queue[-1].get("lastMessageDate")
     return True
 
 
@@ -41,36 +74,27 @@ def paginate_messages(cursor):
         cursor : Cursor object
 
     Returns:
-        list : list of messages
+        bool : True if there is a next page, False otherwise.
     """
 
-    response = cursor._api._call(
-        method="GET",
-        path=cursor._path,
-        data=cursor._params,
-        token_data=cursor.token_data,
-    )
-
-    cursor._headers = response.headers
-
-    body = response.json()
-    messages = body.get("messages")
-    if not messages:
-        return False
+    return _load_messages(cursor, _next_body(cursor))
 
-    cursor._queue = cursor._object_parser.parse_multiple(
-        messages, cursor._target_objects_class, cursor.token_data
-    )
 
-    next_page = messages.get("nextPage")
-    cursor._has_next_page = next_page
+async def paginate_messages_async(cursor):
+    """
+    paginate_messages for AsyncCursor.
+    """
+    return _load_messages(cursor, await _next_body_async(cursor))
 
-    last_message_id = messages.get("lastMessageId")
-    cursor._params["lastMessageId"] = last_message_id
 
-    if not cursor._has_next_page:
+def _load_messages(cursor, body):
+    # messages and their paging fields are nested under "messages"
+    messages = body.get("messages")
+    if not messages or not _fill_queue(cursor, messages):
         return False
-    return True
+
+    cursor._params["lastMessageId"] = messages.get("lastMessageId")
+    return bool(messages.get("nextPage"))
 
 
 def paginate_form_submissions(cursor):
@@ -81,36 +105,35 @@ def paginate_form_submissions(cursor):
         cursor : Cursor object
 
     Returns:
-        list : list of form submissions
+        bool : True if there is a next page, False otherwise.
     """
 
-    response = cursor._api._call(
-        method="GET",
-        path=cursor._path,
-        data=cursor._params,
-        token_data=cursor.token_data,
-    )
+    return _load_form_submissions(cursor, _next_body(cursor))
+
+
+async def paginate_form_submissions_async(cursor):
+    """
+    paginate_form_submissions for AsyncCursor.
+    """
+    return _load_form_submissions(cursor, await _next_body_async(cursor))
 
-    cursor._headers = response.headers
 
-    body = response.json()
+def _load_form_submissions(cursor, body):
     form_submissions = body.get("submissions")
     if not form_submissions:
         return False
 
-    for obj in form_submissions:
-        cursor._queue.append(
-            cursor._object_parser.parse_single(
-                obj, cursor._target_objects_class, cursor.token_data
-            )
-        )
-    meta = body.get("meta")
-    next_page = meta.get("nextPage") if meta else False
-    cursor._has_next_page = next_page
-
-    page = meta.get("currentPage")
-    cursor._params["page"] = int(page) + 1
+    parse_single = cursor._object_parser.parse_single
+    cursor._queue.extend(
+        [
+            parse_single(obj, cursor._target_objects_class, cursor.token_data)
+            for obj in form_submissions
+        ]
+    )
 
-    if not cursor._has_next_page:
+    meta = body.get("meta")
+    if not meta or not meta.get("nextPage"):
         return False
+
+    cursor._params["page"] = int(meta["currentPage"]) + 1
     return True